@@ -15,11 +15,12 @@ from src.database.connection import get_db
 from src.models.user import User, RefreshToken
 from src.models.profile import UserProfile
 from src.utils.security import (
-    hash_password,
-    verify_password,
+    hash_password_async,
+    verify_password_async,
     create_access_token,
     create_refresh_token,
     hash_refresh_token,
+    legacy_refresh_token_hash,
     get_refresh_token_expiry,
 )
 from src.utils.validators import validate_email, validate_password_strength
@@ -77,7 +78,7 @@ async def register(
 
     user = User(
         email=body.email.lower(),
-        password_hash=hash_password(body.password or ""),
+        password_hash=await hash_password_async(body.password or ""),
     )
     db.add(user)
     await db.flush()
@@ -115,7 +116,7 @@ async def login(
         raise HTTPException(status_code=401, detail="Invalid email or password")
     # Demo mode: skip password check when password is empty
     if body.password and body.password.strip():
-        if not verify_password(body.password, user.password_hash):
+        if not await verify_password_async(body.password, user.password_hash):
             raise HTTPException(status_code=401, detail="Invalid email or password")
 
     refresh = create_refresh_token()
@@ -143,10 +144,14 @@ async def refresh_tokens(
     """Issue new access token using refresh token. Rate limited."""
     check_auth_rate_limit(request)
 
-    token_hash = hash_refresh_token(body.refresh_token)
+    # Match tokens stored under either hash until pre-BLAKE2b tokens have expired
+    token_hashes = (
+        hash_refresh_token(body.refresh_token),
+        legacy_refresh_token_hash(body.refresh_token),
+    )
     result = await db.execute(
         select(RefreshToken, User).join(User, RefreshToken.user_id == User.id).where(
-            RefreshToken.token_hash == token_hash,
+            RefreshToken.token_hash.in_(token_hashes),
             RefreshToken.expires_at > datetime.now(timezone.utc),
         )
     )
@@ -48,6 +48,8 @@ class Settings(BaseSettings):
     jwt_algorithm: str = Field(default="HS256", description="JWT algorithm")
     access_token_expire_minutes: int = Field(default=15, ge=1, le=60)
     refresh_token_expire_days: int = Field(default=7, ge=1, le=30)
+    # New password hashes use this; existing bcrypt and argon2 hashes both still verify
+    password_hasher: str = Field(default="bcrypt", pattern="^(bcrypt|argon2)$")
 
     # Rate limiting
     rate_limit_auth_requests: int = Field(default=50, ge=1, description="Auth attempts per window")
@@ -67,6 +69,8 @@ class Settings(BaseSettings):
     openai_model: str = Field(default="gpt-4-turbo-preview")
     openai_timeout_seconds: int = Field(default=30, ge=5)
     openai_max_retries: int = Field(default=3, ge=1)
+    # Strict json_schema response formats need a model that supports structured outputs
+    openai_structured_outputs: bool = Field(default=False)
 
     # LLM cache (Redis)
     llm_cache_ttl_days: int = Field(default=7, ge=1)
@@ -77,6 +81,8 @@ class Settings(BaseSettings):
     scraping_request_delay_min: float = Field(default=1.0, ge=0)
     scraping_request_delay_max: float = Field(default=3.0, ge=0)
     scraping_max_retries: int = Field(default=3, ge=1)
+    scraping_max_connections: int = Field(default=100, ge=1)
+    scraping_max_keepalive: int = Field(default=20, ge=1)
 
     # App
     environment: str = Field(default="development")
@@ -1,13 +1,16 @@
 """
 Base OpenAI client with timeout, retries, and token awareness.
 """
+import asyncio
 import json
 from typing import Any
 
 from openai import AsyncOpenAI
 from openai import APIError, APITimeoutError
+from pydantic import BaseModel
 
 from src.config import get_settings
+from src.services.llm.schemas import strict_json_schema
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -31,12 +34,27 @@ async def chat_completion_json(
     system_prompt: str,
     user_content: str,
     max_tokens: int = 2000,
+    schema: type[BaseModel] | None = None,
 ) -> dict[str, Any]:
     """
     Call OpenAI chat with JSON response. Retries with exponential backoff.
     Returns parsed JSON dict. Raises LLMServiceError on failure.
+
+    With *schema*, the response is validated (and normalized) by that pydantic
+    model and returned as its model_dump(); if settings.openai_structured_outputs
+    is on, the schema is also sent as a strict json_schema response format.
     """
     settings = get_settings()
+    response_format: dict[str, Any] = {"type": "json_object"}
+    if schema is not None and settings.openai_structured_outputs:
+        response_format = {
+            "type": "json_schema",
+            "json_schema": {
+                "name": schema.__name__,
+                "schema": strict_json_schema(schema),
+                "strict": True,
+            },
+        }
     last_error: Exception | None = None
     for attempt in range(settings.openai_max_retries):
         try:
@@ -46,13 +64,15 @@ async def chat_completion_json(
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": user_content},
                 ],
-                response_format={"type": "json_object"},
+                response_format=response_format,
                 max_tokens=max_tokens,
                 timeout=float(settings.openai_timeout_seconds),
             )
             choice = response.choices[0]
             if not choice.message.content:
                 raise LLMServiceError("Empty response from model")
+            if schema is not None:
+                return schema.model_validate_json(choice.message.content).model_dump()
             return json.loads(choice.message.content)
         except (APIError, APITimeoutError) as e:
             last_error = e
@@ -61,6 +81,5 @@ async def chat_completion_json(
                 extra={"attempt": attempt + 1, "error": str(e)[:200]},
             )
             if attempt < settings.openai_max_retries - 1:
-                import asyncio
                 await asyncio.sleep(2 ** attempt)
     raise LLMServiceError(f"OpenAI API failed after retries: {last_error}")
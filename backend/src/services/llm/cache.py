@@ -0,0 +1,91 @@
+"""
+In-memory cache for LLM JSON responses, keyed by a hash of the prompt and input.
+Concurrent calls for the same key share one in-flight request (singleflight), so
+duplicate CVs / job descriptions hit the API once. Per-process for MVP; replace
+with Redis for multi-instance.
+"""
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from src.config import get_settings
+
+# Maximum number of cached responses; least recently used entries are evicted first.
+_MAX_ENTRIES = 2_000
+
+# key -> (expires_at monotonic, value)
+_cache: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+# key -> future resolved by the caller currently producing that key
+_inflight: dict[str, asyncio.Future] = {}
+
+
+def make_cache_key(*parts: str) -> str:
+    """Stable hash of the parts that determine an LLM response."""
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def _get(key: str) -> dict[str, Any] | None:
+    entry = _cache.get(key)
+    if entry is None:
+        return None
+    expires_at, value = entry
+    if expires_at < time.monotonic():
+        del _cache[key]
+        return None
+    _cache.move_to_end(key)
+    return value
+
+
+def _set(key: str, value: dict[str, Any]) -> None:
+    ttl_seconds = get_settings().llm_cache_ttl_days * 86_400
+    _cache[key] = (time.monotonic() + ttl_seconds, value)
+    _cache.move_to_end(key)
+    while len(_cache) > _MAX_ENTRIES:
+        _cache.popitem(last=False)
+
+
+async def cached_json(
+    key: str,
+    producer: Callable[[], Awaitable[dict[str, Any]]],
+) -> dict[str, Any]:
+    """
+    Return the cached value for *key*, or await *producer()* and cache its result.
+    If another task is already producing *key*, wait for its result instead of
+    calling the API again. Returned dicts are shared: treat them as read-only.
+    """
+    cached = _get(key)
+    if cached is not None:
+        return cached
+
+    while (pending := _inflight.get(key)) is not None:
+        try:
+            return await asyncio.shield(pending)
+        except asyncio.CancelledError:
+            if not pending.cancelled():
+                raise  # this caller was cancelled, not the producer
+            # Producer was cancelled: loop and take over (or join a new producer)
+
+    fut: asyncio.Future = asyncio.get_running_loop().create_future()
+    _inflight[key] = fut
+    try:
+        value = await producer()
+    except asyncio.CancelledError:
+        fut.cancel()
+        raise
+    except BaseException as e:
+        fut.set_exception(e)
+        fut.exception()  # mark retrieved so an unwaited future doesn't log a warning
+        raise
+    else:
+        _set(key, value)
+        fut.set_result(value)
+        return value
+    finally:
+        _inflight.pop(key, None)
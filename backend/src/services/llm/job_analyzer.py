@@ -4,6 +4,13 @@ LLM-powered job description analysis. Extracts skills, level, responsibilities.
 from typing import Any
 
 from src.services.llm.base import get_openai_client, chat_completion_json, LLMServiceError
+from src.services.llm.cache import cached_json, make_cache_key
+from src.services.llm.near_duplicate import (
+    compute_minhash,
+    find_near_duplicate,
+    remember as remember_near_duplicate,
+)
+from src.services.llm.schemas import JobAnalysis, JobSummary
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -27,41 +34,37 @@ class JobAnalyzer:
         """
         Parse job description into structured data using LLM.
         Returns dict with required_skills, preferred_skills, experience_level, etc.
+        When the analysis is reused from a near-duplicate description, the dict
+        also has "near_duplicate_of" (cache key of that description).
         """
         if not description or len(description.strip()) < 20:
-            return {
-                "required_skills": [],
-                "preferred_skills": [],
-                "experience_level": None,
-                "experience_years": None,
-                "key_responsibilities": [],
-                "company_size": None,
-            }
+            return JobAnalysis().model_dump()
         try:
             client = get_openai_client()
-            data = await chat_completion_json(
-                client,
-                system_prompt=SYSTEM_PROMPT,
-                user_content=description[:12000],
-                max_tokens=1000,
+            user_content = description[:12000]
+            key = make_cache_key(SYSTEM_PROMPT, user_content)
+            # Reuse the analysis of a near-identical (reposted) description if we have one
+            minhash = compute_minhash(user_content)
+            if minhash is not None:
+                duplicate = find_near_duplicate(minhash)
+                if duplicate is not None:
+                    dup_key, analysis = duplicate
+                    if dup_key == key:
+                        return analysis
+                    return {**analysis, "near_duplicate_of": dup_key}
+            analysis = await cached_json(
+                key,
+                lambda: chat_completion_json(
+                    client,
+                    system_prompt=SYSTEM_PROMPT,
+                    user_content=user_content,
+                    max_tokens=1000,
+                    schema=JobAnalysis,
+                ),
             )
-            required = data.get("required_skills") or []
-            preferred = data.get("preferred_skills") or []
-            if not isinstance(required, list):
-                required = []
-            if not isinstance(preferred, list):
-                preferred = []
-            responsibilities = data.get("key_responsibilities") or []
-            if not isinstance(responsibilities, list):
-                responsibilities = []
-            return {
-                "required_skills": [str(s).strip() for s in required if s][:30],
-                "preferred_skills": [str(s).strip() for s in preferred if s][:20],
-                "experience_level": data.get("experience_level") or None,
-                "experience_years": data.get("experience_years") or None,
-                "key_responsibilities": [str(r).strip() for r in responsibilities if r][:15],
-                "company_size": data.get("company_size") or None,
-            }
+            if minhash is not None:
+                remember_near_duplicate(key, minhash, analysis)
+            return analysis
         except LLMServiceError:
             raise
         except Exception as e:
@@ -76,14 +79,7 @@ class JobAnalyzer:
         advantageous skills. For candidate prep.
         """
         if not description or len(description.strip()) < 20:
-            return {
-                "key_skills": [],
-                "qualifications": [],
-                "cultural_fit": "",
-                "advantageous_skills": [],
-                "expected_salary": "",
-                "industry": "",
-            }
+            return JobSummary().model_dump()
         system = """You are a career coach. Summarise the job posting for a candidate.
 Respond with a single JSON object:
 - "key_skills": array of strings (main skills/technologies they look for)
@@ -97,32 +93,16 @@ Be concise. Use the employer's wording where possible. No fluff."""
         user = f"Company: {company_name}\nRole: {job_title}\n\nDescription:\n{description[:8000]}"
         try:
             client = get_openai_client()
-            data = await chat_completion_json(
-                client,
-                system_prompt=system,
-                user_content=user,
-                max_tokens=800,
+            return await cached_json(
+                make_cache_key(system, user),
+                lambda: chat_completion_json(
+                    client,
+                    system_prompt=system,
+                    user_content=user,
+                    max_tokens=800,
+                    schema=JobSummary,
+                ),
             )
-            key_skills = data.get("key_skills") or []
-            qualifications = data.get("qualifications") or []
-            cultural_fit = data.get("cultural_fit") or ""
-            advantageous_skills = data.get("advantageous_skills") or []
-            expected_salary = data.get("expected_salary") or ""
-            industry = data.get("industry") or ""
-            if not isinstance(key_skills, list):
-                key_skills = []
-            if not isinstance(qualifications, list):
-                qualifications = []
-            if not isinstance(advantageous_skills, list):
-                advantageous_skills = []
-            return {
-                "key_skills": [str(s).strip() for s in key_skills if s][:20],
-                "qualifications": [str(q).strip() for q in qualifications if q][:15],
-                "cultural_fit": str(cultural_fit).strip()[:1500],
-                "advantageous_skills": [str(s).strip() for s in advantageous_skills if s][:15],
-                "expected_salary": str(expected_salary).strip()[:200],
-                "industry": str(industry).strip()[:100],
-            }
         except LLMServiceError:
             raise
         except Exception as e:
@@ -0,0 +1,60 @@
+"""
+Near-duplicate detection for job descriptions (MinHash + LSH). Job boards repost
+almost identical postings across companies and ATS systems; reusing the analysis
+of a near-identical description saves an LLM call. In-memory, per process.
+"""
+from collections import OrderedDict
+from typing import Any
+
+from datasketch import MinHash, MinHashLSH
+
+# Texts shorter than this have too few shingles for a reliable estimate
+MIN_TEXT_LENGTH = 500
+JACCARD_THRESHOLD = 0.9
+NUM_PERM = 128
+SHINGLE_SIZE = 5
+_MAX_ENTRIES = 5_000
+
+_lsh = MinHashLSH(threshold=JACCARD_THRESHOLD, num_perm=NUM_PERM)
+# key -> (minhash, analysis), oldest first for eviction
+_entries: OrderedDict[str, tuple[MinHash, dict[str, Any]]] = OrderedDict()
+
+
+def _shingles(text: str) -> set[str]:
+    return {text[i:i + SHINGLE_SIZE] for i in range(len(text) - SHINGLE_SIZE + 1)}
+
+
+def compute_minhash(text: str) -> MinHash | None:
+    """MinHash of *text*'s character shingles, or None if the text is too short."""
+    if len(text) < MIN_TEXT_LENGTH:
+        return None
+    mh = MinHash(num_perm=NUM_PERM)
+    mh.update_batch([s.encode("utf-8") for s in _shingles(text.lower())])
+    return mh
+
+
+def find_near_duplicate(mh: MinHash) -> tuple[str, dict[str, Any]] | None:
+    """Return (key, analysis) of the closest stored description above the threshold."""
+    best: tuple[float, str] | None = None
+    for key in _lsh.query(mh):
+        entry = _entries.get(key)
+        if entry is None:
+            continue
+        # LSH candidates are approximate; re-check the estimated Jaccard similarity
+        similarity = mh.jaccard(entry[0])
+        if similarity >= JACCARD_THRESHOLD and (best is None or similarity > best[0]):
+            best = (similarity, key)
+    if best is None:
+        return None
+    return best[1], _entries[best[1]][1]
+
+
+def remember(key: str, mh: MinHash, analysis: dict[str, Any]) -> None:
+    """Index an analyzed description so later near-duplicates can reuse it."""
+    if key in _entries:
+        return
+    while len(_entries) >= _MAX_ENTRIES:
+        old_key, _ = _entries.popitem(last=False)
+        _lsh.remove(old_key)
+    _lsh.insert(key, mh)
+    _entries[key] = (mh, analysis)
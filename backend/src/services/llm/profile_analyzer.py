@@ -5,6 +5,8 @@ experience, education, and suggests relevant job titles for searching.
 from typing import Any
 
 from src.services.llm.base import get_openai_client, chat_completion_json, LLMServiceError
+from src.services.llm.cache import cached_json, make_cache_key
+from src.services.llm.schemas import CVAnalysis
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -41,74 +43,20 @@ class ProfileAnalyzer:
         education, total_years_experience, suggested_job_titles.
         """
         if not cv_text or len(cv_text.strip()) < 50:
-            return {
-                "full_name": None,
-                "skills": [],
-                "skill_competencies": [],
-                "experience": [],
-                "education": [],
-                "total_years_experience": 0,
-                "suggested_job_titles": [],
-            }
+            return CVAnalysis().model_dump()
         try:
             client = get_openai_client()
-            data = await chat_completion_json(
-                client,
-                system_prompt=SYSTEM_PROMPT,
-                user_content=cv_text[:15000],
-                max_tokens=2000,
+            user_content = cv_text[:15000]
+            return await cached_json(
+                make_cache_key(SYSTEM_PROMPT, user_content),
+                lambda: chat_completion_json(
+                    client,
+                    system_prompt=SYSTEM_PROMPT,
+                    user_content=user_content,
+                    max_tokens=2000,
+                    schema=CVAnalysis,
+                ),
             )
-
-            # Normalize skills (flat list of strings)
-            skills = data.get("skills") or []
-            if not isinstance(skills, list):
-                skills = []
-
-            # Normalize skill competencies
-            raw_comps = data.get("skill_competencies") or []
-            if not isinstance(raw_comps, list):
-                raw_comps = []
-            skill_competencies: list[dict[str, Any]] = []
-            for item in raw_comps:
-                if isinstance(item, dict) and "skill" in item:
-                    level = item.get("level", 3)
-                    if not isinstance(level, int) or level < 1 or level > 5:
-                        level = 3
-                    skill_competencies.append({
-                        "skill": str(item["skill"]).strip(),
-                        "level": level,
-                    })
-
-            # Normalize experience
-            experience = data.get("experience") or []
-            if not isinstance(experience, list):
-                experience = []
-
-            # Normalize education
-            education = data.get("education") or []
-            if not isinstance(education, list):
-                education = []
-
-            # Years of experience
-            years = data.get("total_years_experience")
-            if years is None or not isinstance(years, (int, float)):
-                years = 0
-
-            # Suggested job titles
-            raw_titles = data.get("suggested_job_titles") or []
-            if not isinstance(raw_titles, list):
-                raw_titles = []
-            suggested_job_titles = [str(t).strip() for t in raw_titles if t][:10]
-
-            return {
-                "full_name": data.get("full_name"),
-                "skills": [str(s).strip() for s in skills if s][:50],
-                "skill_competencies": skill_competencies[:20],
-                "experience": experience[:20],
-                "education": education[:10],
-                "total_years_experience": max(0, int(years)),
-                "suggested_job_titles": suggested_job_titles,
-            }
         except LLMServiceError:
             raise
         except Exception as e:
@@ -0,0 +1,127 @@
+"""
+Pydantic schemas for structured LLM responses. Each model mirrors the JSON
+shape requested by an analyzer's system prompt and normalizes what the model
+returns (wrong types become empty values, strings are stripped, lists are
+truncated) so callers get a well-typed dict from model_dump().
+"""
+from typing import Annotated, Any
+
+from pydantic import BaseModel, BeforeValidator, ConfigDict
+
+
+def _str_list(limit: int) -> BeforeValidator:
+    """Coerce to a list of non-empty stripped strings, at most *limit* long."""
+    def coerce(v: Any) -> list[str]:
+        if not isinstance(v, list):
+            return []
+        return [str(s).strip() for s in v if s][:limit]
+    return BeforeValidator(coerce)
+
+
+def _text(limit: int) -> BeforeValidator:
+    """Coerce to a stripped string of at most *limit* chars ("" when missing)."""
+    return BeforeValidator(lambda v: str(v or "").strip()[:limit])
+
+
+def _optional_str(v: Any) -> str | None:
+    return str(v) if v else None
+
+
+OptionalStr = Annotated[str | None, BeforeValidator(_optional_str)]
+
+
+class JobAnalysis(BaseModel):
+    required_skills: Annotated[list[str], _str_list(30)] = []
+    preferred_skills: Annotated[list[str], _str_list(20)] = []
+    experience_level: OptionalStr = None
+    experience_years: OptionalStr = None
+    key_responsibilities: Annotated[list[str], _str_list(15)] = []
+    company_size: OptionalStr = None
+
+
+class JobSummary(BaseModel):
+    key_skills: Annotated[list[str], _str_list(20)] = []
+    qualifications: Annotated[list[str], _str_list(15)] = []
+    cultural_fit: Annotated[str, _text(1500)] = ""
+    advantageous_skills: Annotated[list[str], _str_list(15)] = []
+    expected_salary: Annotated[str, _text(200)] = ""
+    industry: Annotated[str, _text(100)] = ""
+
+
+def _level(v: Any) -> int:
+    """Competency level 1-5; anything else defaults to 3 (intermediate)."""
+    if not isinstance(v, int) or v < 1 or v > 5:
+        return 3
+    return v
+
+
+class SkillCompetency(BaseModel):
+    skill: Annotated[str, BeforeValidator(lambda v: str(v).strip())]
+    level: Annotated[int, BeforeValidator(_level)] = 3
+
+
+class ExperienceEntry(BaseModel):
+    # Keep any extra keys the model adds; only these three are requested
+    model_config = ConfigDict(extra="allow")
+
+    company: OptionalStr = None
+    role: OptionalStr = None
+    duration: OptionalStr = None
+
+
+def _dicts_with(key: str | None, limit: int) -> BeforeValidator:
+    """Keep only dict items (containing *key*, if given), at most *limit*."""
+    def coerce(v: Any) -> list[dict[str, Any]]:
+        if not isinstance(v, list):
+            return []
+        return [i for i in v if isinstance(i, dict) and (key is None or key in i)][:limit]
+    return BeforeValidator(coerce)
+
+
+def _years(v: Any) -> int:
+    if v is None or not isinstance(v, (int, float)):
+        return 0
+    return max(0, int(v))
+
+
+class CVAnalysis(BaseModel):
+    full_name: OptionalStr = None
+    skills: Annotated[list[str], _str_list(50)] = []
+    skill_competencies: Annotated[list[SkillCompetency], _dicts_with("skill", 20)] = []
+    experience: Annotated[list[ExperienceEntry], _dicts_with(None, 20)] = []
+    education: Annotated[list[str], _str_list(10)] = []
+    total_years_experience: Annotated[int, BeforeValidator(_years)] = 0
+    suggested_job_titles: Annotated[list[str], _str_list(10)] = []
+
+
+class CompanyItem(BaseModel):
+    name: Annotated[str, _text(255)] = ""
+    reason: Annotated[str, _text(500)] = ""
+    industry: Annotated[str, _text(100)] = ""
+
+
+class CompanyList(BaseModel):
+    companies: Annotated[list[CompanyItem], _dicts_with("name", 15)] = []
+
+
+def strict_json_schema(model: type[BaseModel]) -> dict[str, Any]:
+    """
+    JSON schema for *model* in the form OpenAI strict structured outputs
+    require: every object closed, every property required, no defaults.
+    """
+    schema = model.model_json_schema()
+
+    def close(node: Any) -> None:
+        if isinstance(node, dict):
+            node.pop("default", None)
+            if node.get("type") == "object" and "properties" in node:
+                node["additionalProperties"] = False
+                node["required"] = list(node["properties"])
+            for value in node.values():
+                close(value)
+        elif isinstance(node, list):
+            for value in node:
+                close(value)
+
+    close(schema)
+    return schema
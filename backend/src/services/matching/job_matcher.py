@@ -10,12 +10,18 @@ from src.utils.logger import get_logger
 logger = get_logger(__name__)
 
 LEVEL_ORDER = ("entry", "mid", "senior", "lead", "executive")
+_LEVEL_IDX: dict[str, int] = {lvl: i for i, lvl in enumerate(LEVEL_ORDER)}
+# (min years, level), highest first; below the last threshold is "entry"
+_PROFILE_LEVEL_THRESHOLDS = ((10, "executive"), (7, "lead"), (4, "senior"), (2, "mid"))
+# Whitespace and list punctuation LLM output sometimes leaves around a skill.
+# "." is kept so names like ".NET" survive.
+_SKILL_STRIP_CHARS = " \t\n\r,;:()[]"
 
 
 def _normalize_skills(skills: list[str] | None) -> set[str]:
     if not skills:
         return set()
-    return set(s.strip().lower() for s in skills if s and isinstance(s, str))
+    return {s.lower().strip(_SKILL_STRIP_CHARS) for s in skills if isinstance(s, str) and s}
 
 
 def _experience_level_score(
@@ -29,26 +35,17 @@ def _experience_level_score(
     """
     if not job_level:
         return 0.7  # unknown job level: neutral
-    job_level = job_level.strip().lower()
-    try:
-        job_idx = LEVEL_ORDER.index(job_level)
-    except ValueError:
+    job_idx = _LEVEL_IDX.get(job_level.strip().lower())
+    if job_idx is None:
         return 0.7
     # Infer profile level from years
     profile_level = "entry"
     if profile_years is not None:
-        if profile_years >= 10:
-            profile_level = "executive"
-        elif profile_years >= 7:
-            profile_level = "lead"
-        elif profile_years >= 4:
-            profile_level = "senior"
-        elif profile_years >= 2:
-            profile_level = "mid"
-    try:
-        profile_idx = LEVEL_ORDER.index(profile_level)
-    except ValueError:
-        profile_idx = 1
+        profile_level = next(
+            (lvl for years, lvl in _PROFILE_LEVEL_THRESHOLDS if profile_years >= years),
+            "entry",
+        )
+    profile_idx = _LEVEL_IDX.get(profile_level, 1)
     diff = abs(job_idx - profile_idx)
     if diff == 0:
         return 1.0
@@ -8,6 +8,8 @@ from urllib.parse import urlparse
 from urllib.robotparser import RobotFileParser
 
 import httpx
+from aiolimiter import AsyncLimiter
+from selectolax.lexbor import LexborHTMLParser, LexborNode
 
 from src.config import get_settings
 from src.utils.logger import get_logger
@@ -28,6 +30,29 @@ USER_AGENTS = [
 # Cache parsed robots.txt per domain for the lifetime of the process
 _robots_cache: dict[str, RobotFileParser] = {}
 
+# Validators + body of previously fetched pages for conditional GETs:
+# url -> (etag, last_modified, content_type, body). Shared by the search scrapers.
+# Search pages run to a few hundred KB, so the store is bounded by total body
+# size (at most ~32 MiB per process) as well as entry count; oldest go first.
+ConditionalEntry = tuple[str | None, str | None, str | None, bytes]
+response_cache: dict[str, ConditionalEntry] = {}
+_MAX_RESPONSE_CACHE_ENTRIES = 500
+_MAX_RESPONSE_CACHE_BYTES = 32 * 1024 * 1024
+
+# Upper bound on a single retry backoff sleep
+_MAX_BACKOFF_SECONDS = 60.0
+
+# One token bucket per domain so requests to unrelated hosts never wait on each other
+_limiters: dict[str, AsyncLimiter] = {}
+
+# Job cards parsed per search results page. Lexbor's css() has no match limit,
+# but the selector walk runs in C; the cost worth capping is per-card parsing.
+MAX_CARDS_PER_PAGE = 30
+
+# Max detail pages fetched in parallel per source; per-domain politeness is
+# enforced by the rate limiter
+DETAIL_FETCH_CONCURRENCY = 5
+
 
 def get_robots_parser(domain: str) -> RobotFileParser:
     """Fetch and parse robots.txt for a domain (cached in memory)."""
@@ -62,15 +87,62 @@ def can_fetch(robots: RobotFileParser, url: str, user_agent: str = "*") -> bool:
         return True  # fail-open if robots parser itself errors
 
 
-async def rate_limit_delay() -> None:
-    """Sleep for a configured delay to respect per-domain rate limits."""
-    settings = get_settings()
-    base_delay = 1.0 / max(0.5, settings.scraping_rate_limit_per_second)
-    jitter = random.uniform(
-        settings.scraping_request_delay_min,
-        settings.scraping_request_delay_max,
-    )
-    await asyncio.sleep(base_delay + jitter)
+def _get_limiter(domain: str) -> AsyncLimiter:
+    """Return the token-bucket limiter for *domain* (created on first use)."""
+    limiter = _limiters.get(domain)
+    if limiter is None:
+        settings = get_settings()
+        # One token refilled every 1/rate seconds: a bucket of capacity `rate`
+        # can't hand out a whole token when rate < 1 (aiolimiter raises)
+        limiter = AsyncLimiter(1, 1.0 / settings.scraping_rate_limit_per_second)
+        _limiters[domain] = limiter
+    return limiter
+
+
+async def rate_limit_for(url: str) -> None:
+    """Wait until the per-domain rate limit allows a request to *url*."""
+    async with _get_limiter(urlparse(url).netloc):
+        pass
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff with up to 1s of jitter, capped at _MAX_BACKOFF_SECONDS."""
+    return min(_MAX_BACKOFF_SECONDS, 2 ** attempt + random.random())
+
+
+# Unbound method: skips the per-node bound-method lookup in safe_text's hot path
+_node_text = LexborNode.text
+
+
+def safe_text(node: LexborNode | None) -> str:
+    """Get stripped text from a node or empty string."""
+    return _node_text(node, strip=True) if node is not None else ""
+
+
+def block_text(node: LexborNode, limit: int) -> str:
+    """
+    Text of *node*'s subtree, one stripped text node per line, cut to *limit*
+    chars. Lexbor keeps the empty parts left by whitespace-only text nodes, so
+    they are dropped here to match BeautifulSoup's get_text("\\n", strip=True).
+    """
+    text = _node_text(node, separator="\n", strip=True)
+    return "\n".join(part for part in text.split("\n") if part)[:limit]
+
+
+def first_match(
+    node: LexborHTMLParser | LexborNode,
+    selectors: tuple[str, ...],
+) -> LexborNode | None:
+    """
+    Return the first node matched by *selectors*, tried in priority order.
+    A comma selector returns the first match in document order instead, so it
+    only suits alternatives where any match will do.
+    """
+    for selector in selectors:
+        found = node.css_first(selector)
+        if found is not None:
+            return found
+    return None
 
 
 def random_user_agent() -> str:
@@ -78,33 +150,70 @@ def random_user_agent() -> str:
     return random.choice(USER_AGENTS)
 
 
+def _remember_response(etag_store: dict[str, ConditionalEntry], url: str, resp: httpx.Response) -> None:
+    """
+    Store the validators and body of *resp* if the server sent any, evicting the
+    oldest entries to stay within the entry and byte limits.
+    """
+    etag = resp.headers.get("ETag")
+    last_modified = resp.headers.get("Last-Modified")
+    etag_store.pop(url, None)
+    body = resp.content
+    if (not etag and not last_modified) or len(body) > _MAX_RESPONSE_CACHE_BYTES:
+        return
+    total = len(body) + sum(len(entry[3]) for entry in etag_store.values())
+    while etag_store and (
+        len(etag_store) >= _MAX_RESPONSE_CACHE_ENTRIES or total > _MAX_RESPONSE_CACHE_BYTES
+    ):
+        total -= len(etag_store.pop(next(iter(etag_store)))[3])
+    etag_store[url] = (etag, last_modified, resp.headers.get("Content-Type"), body)
+
+
 async def fetch_with_retry(
     client: httpx.AsyncClient,
     url: str,
     *,
     max_retries: int | None = None,
     timeout: float = 30.0,
+    etag_store: dict[str, ConditionalEntry] | None = None,
 ) -> httpx.Response:
     """
     HTTP GET with exponential backoff and retry on transient errors.
+    If *etag_store* is given, sends If-None-Match / If-Modified-Since for URLs
+    seen before and returns the stored body on 304 Not Modified.
     Raises the last exception after all retries are exhausted.
     """
     settings = get_settings()
     retries = max_retries or settings.scraping_max_retries
     last_error: Exception | None = None
+    cached = etag_store.get(url) if etag_store is not None else None
 
     for attempt in range(retries):
         try:
-            await rate_limit_delay()
+            await rate_limit_for(url)
+            headers = {"User-Agent": random_user_agent()}
+            if cached:
+                if cached[0]:
+                    headers["If-None-Match"] = cached[0]
+                if cached[1]:
+                    headers["If-Modified-Since"] = cached[1]
             resp = await client.get(
                 url,
                 timeout=timeout,
                 follow_redirects=True,
-                headers={"User-Agent": random_user_agent()},
+                headers=headers,
             )
+            if resp.status_code == 304 and cached:
+                content_type = cached[2]
+                return httpx.Response(
+                    200,
+                    content=cached[3],
+                    headers={"Content-Type": content_type} if content_type else None,
+                    request=resp.request,
+                )
             # Retry on rate-limit or server unavailable
             if resp.status_code in (429, 503):
-                wait = 2 ** attempt + random.uniform(0, 1)
+                wait = _backoff_delay(attempt)
                 logger.warning(
                     "Scraper rate-limited / unavailable",
                     extra={"status": resp.status_code, "url": url[:100], "wait": round(wait, 1)},
@@ -112,6 +221,8 @@ async def fetch_with_retry(
                 await asyncio.sleep(wait)
                 continue
             resp.raise_for_status()
+            if etag_store is not None:
+                _remember_response(etag_store, url, resp)
             return resp
         except (httpx.HTTPError, httpx.TimeoutException) as e:
             last_error = e
@@ -120,7 +231,7 @@ async def fetch_with_retry(
                 extra={"attempt": attempt + 1, "url": url[:100], "error": str(e)[:120]},
             )
             if attempt < retries - 1:
-                await asyncio.sleep(2 ** attempt + random.uniform(0, 1))
+                await asyncio.sleep(_backoff_delay(attempt))
 
     if last_error:
         raise last_error
@@ -128,10 +239,26 @@ async def fetch_with_retry(
 
 
 def build_httpx_client() -> httpx.AsyncClient:
-    """Create a shared httpx client with sensible defaults for scraping."""
+    """
+    Create a shared httpx client with sensible defaults for scraping.
+    HTTP/2 and a larger pool let concurrent fetches to the same host share connections.
+    """
+    settings = get_settings()
+    # Pool limits and HTTP/2 belong on the transport: httpx ignores the
+    # client-level equivalents when a custom transport is supplied.
+    transport = httpx.AsyncHTTPTransport(
+        http2=True,
+        retries=1,
+        limits=httpx.Limits(
+            max_connections=settings.scraping_max_connections,
+            max_keepalive_connections=settings.scraping_max_keepalive,
+            keepalive_expiry=30.0,
+        ),
+    )
     return httpx.AsyncClient(
+        transport=transport,
         follow_redirects=True,
-        timeout=30.0,
+        timeout=httpx.Timeout(30.0, connect=5.0),
         headers={
             "User-Agent": random_user_agent(),
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
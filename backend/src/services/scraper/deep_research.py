@@ -5,17 +5,18 @@ then scrapes each company's job openings from LinkedIn.
 Yields progress events as async generator for SSE streaming.
 """
 import asyncio
-import json
 from dataclasses import dataclass, field
 from typing import Any, AsyncGenerator
 
-from sqlalchemy import select
+import httpx
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config import get_settings
-from src.models.job import Job
 from src.services.llm.base import get_openai_client, chat_completion_json, LLMServiceError
-from src.services.scraper.base_scraper import build_httpx_client
+from src.services.llm.schemas import CompanyList
+from src.services.scraper.base_scraper import DETAIL_FETCH_CONCURRENCY, build_httpx_client
+from src.services.scraper.job_store import get_existing_urls, insert_new_jobs
 from src.services.scraper.linkedin_scraper import (
     scrape_linkedin_search,
     fetch_linkedin_job_detail,
@@ -67,12 +68,12 @@ class CompanySearchResult:
 @dataclass
 class DeepResearchProgress:
     """A single progress event to stream to the client."""
-    event: str  # research_start, companies_found, searching_company, company_done, job_saved, complete, error
+    event: str  # research_start, companies_found, searching_company, company_done, complete, error
     data: dict[str, Any] = field(default_factory=dict)
 
     def to_sse(self) -> str:
         """Format as Server-Sent Event."""
-        payload = json.dumps(self.data, default=str)
+        payload = orjson.dumps(self.data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
         return f"event: {self.event}\ndata: {payload}\n\n"
 
 
@@ -88,27 +89,28 @@ async def _research_companies(role: str, location: str) -> list[CompanyInfo]:
         system_prompt=COMPANY_RESEARCH_PROMPT,
         user_content=user_content,
         max_tokens=1500,
+        schema=CompanyList,
     )
-
-    raw = data.get("companies") or []
-    if not isinstance(raw, list):
-        return []
-
-    companies: list[CompanyInfo] = []
-    for item in raw:
-        if isinstance(item, dict) and item.get("name"):
-            companies.append(CompanyInfo(
-                name=str(item["name"]).strip(),
-                reason=str(item.get("reason", "")).strip(),
-                industry=str(item.get("industry", "")).strip(),
-            ))
-    return companies[:15]
-
-
-async def _get_existing_urls(db: AsyncSession) -> set[str]:
-    """Load existing job URLs for dedup."""
-    result = await db.execute(select(Job.job_url).where(Job.job_url.isnot(None)))
-    return {row[0] for row in result.all() if row[0]}
+    return [
+        CompanyInfo(name=c["name"], reason=c["reason"], industry=c["industry"])
+        for c in data["companies"]
+        if c["name"]
+    ]
+
+
+async def _safe_fetch_detail(
+    http_client: httpx.AsyncClient,
+    job_id: str | None,
+    sem: asyncio.Semaphore,
+) -> str:
+    """Fetch a LinkedIn job description under *sem*; empty string on failure."""
+    if not job_id:
+        return ""
+    async with sem:
+        try:
+            return await fetch_linkedin_job_detail(http_client, job_id)
+        except Exception:
+            return ""
 
 
 async def run_deep_research(
@@ -124,9 +126,12 @@ async def run_deep_research(
     2. companies_found - list of companies identified
     3. searching_company - starting search for a specific company
     4. company_done - finished searching a company (with results)
-    5. job_saved - a new job was saved
-    6. complete - all done with summary
-    7. error - something went wrong
+    5. complete - all done with summary
+    6. error - something went wrong
+
+    New jobs are reported in aggregate (company_done "new", complete "total_new")
+    rather than one event per job: rows are bulk-inserted after the last company,
+    so there is no per-job save to announce and each company costs one SSE write.
 
     The caller should iterate this and stream each event as SSE.
     """
@@ -161,10 +166,14 @@ async def run_deep_research(
     )
 
     # Phase 2: Search each company on LinkedIn
-    existing_urls = await _get_existing_urls(db)
-    total_new = 0
+    # URLs queued for insert in this run, so the same posting found under two
+    # companies is only saved once
+    seen_urls: set[str] = set()
+    rows: list[dict[str, Any]] = []
     company_results: list[dict[str, Any]] = []
 
+    detail_sem = asyncio.Semaphore(DETAIL_FETCH_CONCURRENCY)
+
     async with build_httpx_client() as http_client:
         for i, company in enumerate(companies):
             yield DeepResearchProgress(
@@ -201,42 +210,41 @@ async def run_deep_research(
                 company_results.append({"company": company.name, "found": 0, "new": 0, "status": "error"})
                 continue
 
-            company_new = 0
-            for stub in stubs:
-                url = stub.get("job_url", "")
-                if url in existing_urls:
-                    continue
-
-                # Fetch full description
-                description = ""
-                if fetch_details and stub.get("job_id"):
-                    try:
-                        description = await fetch_linkedin_job_detail(http_client, stub["job_id"])
-                    except Exception:
-                        pass
-
+            candidate_urls = [s["job_url"] for s in stubs if s.get("job_url")]
+            existing_urls = await get_existing_urls(db, candidate_urls)
+            new_stubs = [
+                s for s in stubs
+                if s.get("job_url") and s["job_url"] not in existing_urls and s["job_url"] not in seen_urls
+            ]
+            company_new = len(new_stubs)
+
+            # Fetch full descriptions concurrently
+            if fetch_details:
+                details = await asyncio.gather(*[
+                    _safe_fetch_detail(http_client, s.get("job_id"), detail_sem)
+                    for s in new_stubs
+                ])
+            else:
+                details = [""] * len(new_stubs)
+
+            for stub, description in zip(new_stubs, details):
+                url = stub["job_url"]
                 if not description:
                     description = stub.get("snippet") or ""
 
-                job = Job(
-                    company_name=stub.get("company_name") or company.name,
-                    job_title=stub.get("job_title") or "Unknown",
-                    job_description=description,
-                    required_skills=[],
-                    preferred_skills=[],
-                    location=stub.get("location"),
-                    job_url=url,
-                    source="deep_research",
-                    posted_date=stub.get("posted_date"),
-                    is_active=True,
-                )
-                db.add(job)
-                existing_urls.add(url)
-                company_new += 1
-                total_new += 1
-
-            if company_new > 0:
-                await db.flush()
+                rows.append({
+                    "company_name": stub.get("company_name") or company.name,
+                    "job_title": stub.get("job_title") or "Unknown",
+                    "job_description": description,
+                    "required_skills": [],
+                    "preferred_skills": [],
+                    "location": stub.get("location"),
+                    "job_url": url,
+                    "source": "deep_research",
+                    "posted_date": stub.get("posted_date"),
+                    "is_active": True,
+                })
+                seen_urls.add(url)
 
             yield DeepResearchProgress(
                 event="company_done",
@@ -254,6 +262,10 @@ async def run_deep_research(
                 "status": "done",
             })
 
+    # Single executemany for all new jobs; rows skipped by ON CONFLICT (saved by
+    # a concurrent scrape since the dedup lookup) don't count as new
+    total_new = len(await insert_new_jobs(db, rows))
+
     # Phase 3: Complete
     yield DeepResearchProgress(
         event="complete",
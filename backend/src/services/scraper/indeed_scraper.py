@@ -8,14 +8,20 @@ with multiple fallbacks.
 from datetime import date, timedelta
 from typing import Any
 from urllib.parse import quote_plus, urljoin, urlparse, parse_qs
+import re
 
-from bs4 import BeautifulSoup, Tag
+from selectolax.lexbor import LexborHTMLParser, LexborNode
 import httpx
 
 from src.services.scraper.base_scraper import (
     fetch_with_retry,
     get_robots_parser,
+    block_text,
     can_fetch,
+    first_match,
+    safe_text,
+    response_cache,
+    MAX_CARDS_PER_PAGE,
 )
 from src.utils.logger import get_logger
 
@@ -24,6 +30,29 @@ logger = get_logger(__name__)
 INDEED_BASE = "https://www.indeed.com"
 INDEED_DOMAIN = "www.indeed.com"
 
+# Card selectors. Tuples are priority-ordered fallbacks, tried in turn with
+# first_match; a comma selector would return whichever match comes first in the
+# document instead, so it is only used where any match will do.
+_CARD_SELECTORS = ("div[data-jk]", "td.resultContent", ".job_seen_beacon", ".jobsearch-SerpJobCard")
+# Any job link will do, so the first one in the card wins
+_LINK_SEL = 'a[href*="/viewjob"], a[href*="/rc/clk"], a[href*="/job/"]'
+_TITLE_SELECTORS = (
+    "h2.jobTitle a span",
+    "h2.jobTitle span",
+    "h2.jobTitle",
+    "[data-testid='jobTitle']",
+    ".jobTitle",
+)
+_COMPANY_SELECTORS = ("[data-testid='company-name']", ".companyName", ".company")
+_LOCATION_SELECTORS = ("[data-testid='text-location']", ".companyLocation", ".location")
+_SNIPPET_SELECTORS = (".job-snippet", "[class*='snippet']", ".summary")
+# span.visually-hidden is generic screen-reader text, so it must stay a last resort
+_DATE_SELECTORS = ("[data-testid='myJobsStateDate']", ".date", "span.visually-hidden")
+_DESCRIPTION_SELECTORS = ("#jobDescriptionText", ".jobsearch-jobDescriptionText", "[class*='jobDescription']")
+
+# First number in a relative date such as "Posted 3 days ago"
+_DIGITS_RE = re.compile(r"\d+")
+
 
 # ---------------------------------------------------------------------------
 # Date parsing helpers
@@ -39,9 +68,9 @@ def _parse_relative_date(text: str | None) -> date | None:
         return today
     if "yesterday" in t:
         return today - timedelta(days=1)
-    digits = "".join(c for c in t if c.isdigit())
-    if digits:
-        n = int(digits)
+    m = _DIGITS_RE.search(t)
+    if m:
+        n = int(m.group())
         if "hour" in t:
             return today
         if "day" in t:
@@ -57,18 +86,24 @@ def _parse_relative_date(text: str | None) -> date | None:
 # HTML parsing
 # ---------------------------------------------------------------------------
 
-def _extract_job_key(card: Tag) -> str | None:
+def _extract_job_key(card: LexborNode) -> str | None:
     """Extract the unique job key (jk) from a card element."""
-    jk = card.get("data-jk")
+    jk = card.attributes.get("data-jk")
     if jk:
-        return str(jk)
-    link = card.select_one("a[data-jk]")
-    if link:
-        return str(link.get("data-jk", ""))
+        return jk
+    link = card.css_first("a[data-jk]")
+    if link is not None:
+        return link.attributes.get("data-jk") or ""
     # Try extracting from href query params
-    a_tag = card.select_one("a[href]")
-    if a_tag:
-        href = str(a_tag.get("href", ""))
+    a_tag = card.css_first("a[href]")
+    if a_tag is not None:
+        href = a_tag.attributes.get("href") or ""
+        # Fast path: plain "?jk=<hex>" / "&jk=<hex>" param, no URL parsing needed
+        i = href.find("jk=")
+        if i > 0 and href[i - 1] in "?&":
+            jk = href[i + 3:].split("&", 1)[0].split("#", 1)[0]
+            if jk.isalnum():
+                return jk
         qs = parse_qs(urlparse(href).query)
         jk_list = qs.get("jk", [])
         if jk_list:
@@ -76,76 +111,52 @@ def _extract_job_key(card: Tag) -> str | None:
     return None
 
 
-def _safe_text(tag: Tag | None) -> str:
-    """Get stripped text from a tag or empty string."""
-    return tag.get_text(strip=True) if tag else ""
-
-
 def parse_indeed_search_html(html: str, base_url: str) -> list[dict[str, Any]]:
     """
     Parse an Indeed search results page into a list of job stubs.
     Each stub has: job_title, company_name, location, job_url, snippet, posted_date, source.
     """
-    soup = BeautifulSoup(html, "html.parser")
+    tree = LexborHTMLParser(html)
     jobs: list[dict[str, Any]] = []
 
     # Indeed wraps each job card in an element with data-jk (job key)
-    cards = (
-        soup.select("div[data-jk]")
-        or soup.select("td.resultContent")
-        or soup.select(".job_seen_beacon")
-        or soup.select(".jobsearch-SerpJobCard")
-    )
-
-    for card in cards[:30]:
+    cards: list[LexborNode] = []
+    for selector in _CARD_SELECTORS:
+        cards = tree.css(selector)
+        if cards:
+            break
+
+    for card in cards[:MAX_CARDS_PER_PAGE]:
         # Job URL
         jk = _extract_job_key(card)
         if jk:
             job_url = f"{base_url}/viewjob?jk={jk}"
         else:
-            link = card.select_one('a[href*="/viewjob"], a[href*="/rc/clk"], a[href*="/job/"]')
-            href = str(link.get("href", "")) if link else ""
+            link = card.css_first(_LINK_SEL)
+            href = (link.attributes.get("href") or "") if link is not None else ""
             if not href:
                 continue
-            job_url = urljoin(base_url, href)
+            # Root-relative hrefs are the norm; skip urljoin's parsing for them
+            if href.startswith("/") and not href.startswith("//"):
+                job_url = f"{base_url}{href}"
+            else:
+                job_url = urljoin(base_url, href)
 
         # Title
-        title = _safe_text(
-            card.select_one("h2.jobTitle a span")
-            or card.select_one("h2.jobTitle span")
-            or card.select_one("h2.jobTitle")
-            or card.select_one("[data-testid='jobTitle']")
-            or card.select_one(".jobTitle")
-        ) or "Unknown"
+        title = safe_text(first_match(card, _TITLE_SELECTORS)) or "Unknown"
 
         # Company
-        company = _safe_text(
-            card.select_one("[data-testid='company-name']")
-            or card.select_one(".companyName")
-            or card.select_one(".company")
-        ) or "Unknown"
+        company = safe_text(first_match(card, _COMPANY_SELECTORS)) or "Unknown"
 
         # Location
-        location = _safe_text(
-            card.select_one("[data-testid='text-location']")
-            or card.select_one(".companyLocation")
-            or card.select_one(".location")
-        ) or None
+        location = safe_text(first_match(card, _LOCATION_SELECTORS)) or None
 
         # Snippet (short description visible on search page)
-        snippet = _safe_text(
-            card.select_one(".job-snippet")
-            or card.select_one("[class*='snippet']")
-            or card.select_one(".summary")
-        )[:500]
+        snippet = safe_text(first_match(card, _SNIPPET_SELECTORS))[:500]
 
         # Posted date
-        date_el = (
-            card.select_one("[data-testid='myJobsStateDate']")
-            or card.select_one(".date")
-            or card.select_one("span.visually-hidden")
-        )
-        posted = _parse_relative_date(_safe_text(date_el))
+        date_el = first_match(card, _DATE_SELECTORS)
+        posted = _parse_relative_date(safe_text(date_el))
 
         jobs.append({
             "job_title": title,
@@ -162,14 +173,10 @@ def parse_indeed_search_html(html: str, base_url: str) -> list[dict[str, Any]]:
 
 def parse_indeed_detail_html(html: str) -> str:
     """Extract the full job description text from an Indeed detail page."""
-    soup = BeautifulSoup(html, "html.parser")
-    desc_el = (
-        soup.select_one("#jobDescriptionText")
-        or soup.select_one(".jobsearch-jobDescriptionText")
-        or soup.select_one("[class*='jobDescription']")
-    )
-    if desc_el:
-        return desc_el.get_text(separator="\n", strip=True)[:15_000]
+    tree = LexborHTMLParser(html)
+    desc_el = first_match(tree, _DESCRIPTION_SELECTORS)
+    if desc_el is not None:
+        return block_text(desc_el, 15_000)
     return ""
 
 
@@ -201,7 +208,7 @@ async def scrape_indeed_search(
             logger.info("robots.txt advisory: Indeed path may be restricted", extra={"url": search_url[:80]})
 
         try:
-            resp = await fetch_with_retry(client, search_url)
+            resp = await fetch_with_retry(client, search_url, etag_store=response_cache)
         except Exception as e:
             logger.error("Indeed search fetch failed", extra={"error": str(e)[:200]})
             break
@@ -0,0 +1,33 @@
+"""
+Database side of scraping, shared by the orchestrator and deep research:
+existence checks for scraped URLs and the bulk insert of new jobs.
+"""
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.job import Job
+
+async def get_existing_urls(db: AsyncSession, candidate_urls: list[str]) -> set[str]:
+    """Return the subset of *candidate_urls* already stored (single indexed lookup)."""
+    if not candidate_urls:
+        return set()
+    result = await db.execute(select(Job.job_url).where(Job.job_url.in_(candidate_urls)))
+    return set(result.scalars())
+
+
+async def insert_new_jobs(db: AsyncSession, rows: list[dict[str, Any]]) -> list[str | None]:
+    """
+    Bulk-insert *rows* in one executemany, skipping any whose job_url already
+    exists (e.g. saved by a concurrent scrape since the existence check).
+    Returns the source of each row actually inserted.
+    """
+    if not rows:
+        return []
+    result = await db.execute(
+        insert(Job).on_conflict_do_nothing(index_elements=["job_url"]).returning(Job.source),
+        rows,
+    )
+    return list(result.scalars())
@@ -18,13 +18,18 @@ from typing import Any
 from urllib.parse import quote_plus, urlparse, parse_qs
 import re
 
-from bs4 import BeautifulSoup, Tag
+from selectolax.lexbor import LexborHTMLParser, LexborNode
 import httpx
 
 from src.services.scraper.base_scraper import (
     fetch_with_retry,
     get_robots_parser,
+    block_text,
     can_fetch,
+    first_match,
+    safe_text,
+    response_cache,
+    MAX_CARDS_PER_PAGE,
 )
 from src.utils.logger import get_logger
 
@@ -36,6 +41,29 @@ LINKEDIN_BASE = "https://www.linkedin.com"
 SEARCH_API = f"{LINKEDIN_BASE}/jobs-guest/jobs/api/seeMoreJobPostings/search"
 DETAIL_API = f"{LINKEDIN_BASE}/jobs-guest/jobs/api/jobPosting"
 
+# Card selectors. Tuples are priority-ordered fallbacks, tried in turn with
+# first_match; a comma selector would return whichever match comes first in the
+# document instead, so it is only used where any match will do.
+_CARD_SELECTORS = (
+    "li.jobs-search-results__list-item",
+    "div.base-card",
+    # Last resort: only <li>s holding a card link, not every nav/footer item
+    "li:has(a.base-card__full-link, a[href*='/jobs/view/'])",
+)
+_TITLE_SELECTORS = ("h3.base-search-card__title", ".base-search-card__title", "h3")
+_LINK_SELECTORS = ("a.base-card__full-link", "a[href*='/jobs/view/']")
+_COMPANY_SELECTORS = ("h4.base-search-card__subtitle", ".base-search-card__subtitle", "h4")
+_LOCATION_SELECTORS = (".job-search-card__location", ".base-search-card__metadata span")
+_LISTDATE_SELECTORS = (".job-search-card__listdate", ".job-search-card__listdate--new")
+_DESCRIPTION_SELECTORS = (".show-more-less-html__markup", ".description__text", "section.description")
+
+# Pattern: /jobs/view/1234567... or /jobs-guest/.../1234567
+_JOB_ID_RE = re.compile(r"/(?:view|jobs)/(\d{6,})")
+# data-entity-urn="urn:li:jobPosting:1234567"
+_URN_RE = re.compile(r"jobPosting:(\d+)")
+# First number in a relative date such as "2 weeks ago"
+_DIGITS_RE = re.compile(r"\d+")
+
 
 # ---------------------------------------------------------------------------
 # Date helpers
@@ -49,8 +77,8 @@ def _parse_linkedin_date(text: str | None) -> date | None:
     today = date.today()
     if "just now" in t or "moment" in t:
         return today
-    digits = "".join(c for c in t if c.isdigit())
-    n = int(digits) if digits else 0
+    m = _DIGITS_RE.search(t)
+    n = int(m.group()) if m else 0
     if "hour" in t or "minute" in t:
         return today
     if "day" in t:
@@ -62,29 +90,24 @@ def _parse_linkedin_date(text: str | None) -> date | None:
     return None
 
 
-def _extract_linkedin_job_id(url_or_el: str | Tag) -> str | None:
+def _extract_linkedin_job_id(url_or_el: str | LexborNode) -> str | None:
     """Extract the numeric job ID from a LinkedIn URL or anchor element."""
-    if isinstance(url_or_el, Tag):
-        href = str(url_or_el.get("href", ""))
+    if isinstance(url_or_el, LexborNode):
+        href = url_or_el.attributes.get("href") or ""
     else:
         href = url_or_el
-    # Pattern: /jobs/view/1234567... or /jobs-guest/.../1234567
-    match = re.search(r"/(?:view|jobs)/(\d{6,})", href)
+    match = _JOB_ID_RE.search(href)
     if match:
         return match.group(1)
     # Fallback: data-entity-urn="urn:li:jobPosting:1234567"
-    if isinstance(url_or_el, Tag):
-        urn = str(url_or_el.get("data-entity-urn", ""))
-        m = re.search(r"jobPosting:(\d+)", urn)
+    if isinstance(url_or_el, LexborNode):
+        urn = url_or_el.attributes.get("data-entity-urn") or ""
+        m = _URN_RE.search(urn)
         if m:
             return m.group(1)
     return None
 
 
-def _safe_text(tag: Tag | None) -> str:
-    return tag.get_text(strip=True) if tag else ""
-
-
 # ---------------------------------------------------------------------------
 # HTML parsing
 # ---------------------------------------------------------------------------
@@ -95,29 +118,24 @@ def parse_linkedin_search_html(html: str) -> list[dict[str, Any]]:
     Returns a list of job stubs with: job_title, company_name, location,
     job_url, job_id, posted_date, source.
     """
-    soup = BeautifulSoup(html, "html.parser")
+    tree = LexborHTMLParser(html)
     jobs: list[dict[str, Any]] = []
 
     # Each card is a <li> or <div> with a base-card class
-    cards = (
-        soup.select("li.jobs-search-results__list-item")
-        or soup.select("div.base-card")
-        or soup.select("li")
-    )
+    cards: list[LexborNode] = []
+    for selector in _CARD_SELECTORS:
+        cards = tree.css(selector)
+        if cards:
+            break
 
-    for card in cards[:30]:
+    for card in cards[:MAX_CARDS_PER_PAGE]:
         # Title & link
-        title_el = (
-            card.select_one("h3.base-search-card__title")
-            or card.select_one(".base-search-card__title")
-            or card.select_one("h3")
-        )
-        title = _safe_text(title_el) or "Unknown"
+        title = safe_text(first_match(card, _TITLE_SELECTORS)) or "Unknown"
 
-        link_el = card.select_one("a.base-card__full-link") or card.select_one("a[href*='/jobs/view/']")
-        if not link_el:
+        link_el = first_match(card, _LINK_SELECTORS)
+        if link_el is None:
             continue
-        href = str(link_el.get("href", ""))
+        href = link_el.attributes.get("href") or ""
         job_id = _extract_linkedin_job_id(href)
         if not job_id:
             job_id = _extract_linkedin_job_id(card)
@@ -127,31 +145,28 @@ def parse_linkedin_search_html(html: str) -> list[dict[str, Any]]:
         job_url = f"{LINKEDIN_BASE}/jobs/view/{job_id}"
 
         # Company
-        company = _safe_text(
-            card.select_one("h4.base-search-card__subtitle")
-            or card.select_one(".base-search-card__subtitle")
-            or card.select_one("h4")
-        ) or "Unknown"
+        company = safe_text(first_match(card, _COMPANY_SELECTORS)) or "Unknown"
 
         # Location
-        location = _safe_text(
-            card.select_one(".job-search-card__location")
-            or card.select_one(".base-search-card__metadata span")
-        ) or None
+        location = safe_text(first_match(card, _LOCATION_SELECTORS)) or None
 
         # Date
-        time_el = card.select_one("time")
-        date_text = time_el.get("datetime") if time_el else _safe_text(
-            card.select_one(".job-search-card__listdate")
-            or card.select_one(".job-search-card__listdate--new")
+        time_el = card.css_first("time")
+        date_text = (
+            time_el.attributes.get("datetime") if time_el is not None
+            else safe_text(first_match(card, _LISTDATE_SELECTORS))
         )
         posted = None
         if date_text:
-            # datetime attr is ISO: "2026-02-05"
-            try:
-                posted = date.fromisoformat(str(date_text)[:10])
-            except ValueError:
-                posted = _parse_linkedin_date(str(date_text))
+            # datetime attr is ISO: "2026-02-05"; only try it when it looks like one
+            iso = date_text[:10]
+            if len(iso) == 10 and iso[4] == "-" and iso[7] == "-" and iso[:4].isdigit():
+                try:
+                    posted = date.fromisoformat(iso)
+                except ValueError:
+                    pass
+            else:
+                posted = _parse_linkedin_date(date_text)
 
         jobs.append({
             "job_title": title,
@@ -169,14 +184,10 @@ def parse_linkedin_search_html(html: str) -> list[dict[str, Any]]:
 
 def parse_linkedin_detail_html(html: str) -> str:
     """Extract the full description text from a LinkedIn guest detail page."""
-    soup = BeautifulSoup(html, "html.parser")
-    desc = (
-        soup.select_one(".show-more-less-html__markup")
-        or soup.select_one(".description__text")
-        or soup.select_one("section.description")
-    )
-    if desc:
-        return desc.get_text(separator="\n", strip=True)[:15_000]
+    tree = LexborHTMLParser(html)
+    desc = first_match(tree, _DESCRIPTION_SELECTORS)
+    if desc is not None:
+        return block_text(desc, 15_000)
     return ""
 
 
@@ -211,7 +222,9 @@ async def scrape_linkedin_search(
             logger.info("robots.txt advisory: LinkedIn path may be restricted", extra={"url": url[:100]})
 
         try:
-            resp = await fetch_with_retry(client, url, max_retries=2, timeout=20.0)
+            resp = await fetch_with_retry(
+                client, url, max_retries=2, timeout=20.0, etag_store=response_cache,
+            )
         except Exception as e:
             logger.error(
                 "LinkedIn search fetch failed",
@@ -8,16 +8,19 @@ Usage from an API route:
     result = await run_scrape(db, query="python developer", location="Remote")
 """
 import asyncio
+import random
+from collections import Counter
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from datetime import date
 from typing import Any
 
-from sqlalchemy import select
+import httpx
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config import get_settings
-from src.models.job import Job
-from src.services.scraper.base_scraper import build_httpx_client
+from src.services.scraper.base_scraper import DETAIL_FETCH_CONCURRENCY, build_httpx_client
+from src.services.scraper.job_store import get_existing_urls, insert_new_jobs
 from src.services.scraper.indeed_scraper import (
     scrape_indeed_search,
     fetch_indeed_job_detail,
@@ -31,7 +34,7 @@ from src.utils.logger import get_logger
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ScrapeResult:
     """Summary of a scraping run."""
     source: str
@@ -42,7 +45,7 @@ class ScrapeResult:
     errors: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ScrapeReport:
     """Aggregated report across all sources."""
     results: list[ScrapeResult] = field(default_factory=list)
@@ -65,124 +68,146 @@ class ScrapeReport:
         }
 
 
-async def _get_existing_urls(db: AsyncSession) -> set[str]:
-    """Load all known job_url values from the DB to deduplicate cheaply."""
-    result = await db.execute(select(Job.job_url).where(Job.job_url.isnot(None)))
-    return {row[0] for row in result.all() if row[0]}
-
-
-def _stub_to_job(stub: dict[str, Any], description: str) -> Job:
-    """Convert a scraper stub dict + full description into a Job model instance."""
-    return Job(
-        company_name=stub.get("company_name") or "Unknown",
-        job_title=stub.get("job_title") or "Unknown",
-        job_description=description or stub.get("snippet") or "",
-        required_skills=[],  # will be populated by LLM analysis later
-        preferred_skills=[],
-        location=stub.get("location"),
-        job_url=stub.get("job_url"),
-        source=stub.get("source"),
-        posted_date=stub.get("posted_date"),
-        is_active=True,
-    )
-
-
-async def _scrape_source_indeed(
-    query: str,
-    location: str,
-    max_results: int,
+def _stub_to_row(stub: dict[str, Any], description: str) -> dict[str, Any]:
+    """Convert a scraper stub dict + full description into a jobs row for bulk insert."""
+    return {
+        "company_name": stub.get("company_name") or "Unknown",
+        "job_title": stub.get("job_title") or "Unknown",
+        "job_description": description or stub.get("snippet") or "",
+        "required_skills": [],  # will be populated by LLM analysis later
+        "preferred_skills": [],
+        "location": stub.get("location"),
+        "job_url": stub.get("job_url"),
+        "source": stub.get("source"),
+        "posted_date": stub.get("posted_date"),
+        "is_active": True,
+    }
+
+
+def _filter_new(
+    result: ScrapeResult,
+    stubs: list[dict[str, Any]],
     existing_urls: set[str],
-    db: AsyncSession,
-    fetch_details: bool,
-) -> ScrapeResult:
-    """Scrape Indeed, fetch details, persist new jobs."""
-    result = ScrapeResult(source="indeed")
-    async with build_httpx_client() as client:
+) -> list[dict[str, Any]]:
+    """Drop stubs whose job_url is already known, counting them as duplicates."""
+    new_stubs = [stub for stub in stubs if stub.get("job_url", "") not in existing_urls]
+    result.jobs_skipped_duplicate += len(stubs) - len(new_stubs)
+    return new_stubs
+
+
+async def _fetch_bounded(
+    sem: asyncio.Semaphore,
+    fetch: Callable[[httpx.AsyncClient, str], Awaitable[str]],
+    client: httpx.AsyncClient,
+    key: str | None,
+) -> str:
+    """
+    Run fetch(client, key) under *sem*, then pause for the configured politeness
+    delay before releasing the slot. Returns "" when there is nothing to fetch.
+    """
+    if not key:
+        return ""
+    settings = get_settings()
+    async with sem:
         try:
-            stubs = await scrape_indeed_search(client, query, location, max_results)
-        except Exception as e:
-            result.errors.append(f"Search failed: {str(e)[:200]}")
-            return result
-
-        result.jobs_found = len(stubs)
-
-        for stub in stubs:
-            url = stub.get("job_url", "")
-            if url in existing_urls:
-                result.jobs_skipped_duplicate += 1
-                continue
-
-            # Fetch full description from detail page
-            description = ""
-            if fetch_details and url:
-                try:
-                    description = await fetch_indeed_job_detail(client, url)
-                    if description:
-                        result.jobs_enriched += 1
-                except Exception as e:
-                    result.errors.append(f"Detail fetch: {str(e)[:100]}")
+            return await fetch(client, key)
+        finally:
+            await asyncio.sleep(random.uniform(
+                settings.scraping_request_delay_min,
+                settings.scraping_request_delay_max,
+            ))
+
+
+async def _fetch_descriptions(
+    result: ScrapeResult,
+    stubs: list[dict[str, Any]],
+    fetch: Callable[[httpx.AsyncClient, str], Awaitable[str]],
+    client: httpx.AsyncClient,
+    key_field: str,
+) -> list[str]:
+    """Fetch detail descriptions for *stubs* concurrently, recording enrichments and errors."""
+    sem = asyncio.Semaphore(DETAIL_FETCH_CONCURRENCY)
+    fetched = await asyncio.gather(
+        *[_fetch_bounded(sem, fetch, client, stub.get(key_field)) for stub in stubs],
+        return_exceptions=True,
+    )
+    descriptions: list[str] = []
+    for item in fetched:
+        if isinstance(item, Exception):
+            result.errors.append(f"Detail fetch: {str(item)[:100]}")
+            descriptions.append("")
+        else:
+            if item:
+                result.jobs_enriched += 1
+            descriptions.append(item)
+    return descriptions
+
+
+def _add_new_jobs(
+    result: ScrapeResult,
+    stubs: list[dict[str, Any]],
+    descriptions: list[str],
+    rows: list[dict[str, Any]],
+) -> None:
+    """Queue stubs that have some content; snippet stands in for a missing description."""
+    for stub, description in zip(stubs, descriptions):
+        if not description:
+            description = stub.get("snippet") or ""
+
+        # Only save if we have at least some content
+        if len(description.strip()) < 20 and not stub.get("job_title"):
+            continue
 
-            if not description:
-                description = stub.get("snippet") or ""
+        rows.append(_stub_to_row(stub, description))
+        result.jobs_new += 1
 
-            # Only save if we have at least some content
-            if len(description.strip()) < 20 and not stub.get("job_title"):
-                continue
 
-            job = _stub_to_job(stub, description)
-            db.add(job)
-            existing_urls.add(url)  # prevent duplicates within the same run
-            result.jobs_new += 1
+SearchFn = Callable[[httpx.AsyncClient, str, str, int], Awaitable[list[dict[str, Any]]]]
+DetailFn = Callable[[httpx.AsyncClient, str], Awaitable[str]]
 
-    return result
+# source name -> (search, detail fetch, stub field passed to the detail fetch)
+_SOURCES: dict[str, tuple[SearchFn, DetailFn, str]] = {
+    "indeed": (scrape_indeed_search, fetch_indeed_job_detail, "job_url"),
+    "linkedin": (scrape_linkedin_search, fetch_linkedin_job_detail, "job_id"),
+}
 
 
-async def _scrape_source_linkedin(
+async def _search_source(
+    client: httpx.AsyncClient,
+    source: str,
     query: str,
     location: str,
     max_results: int,
+) -> tuple[ScrapeResult, list[dict[str, Any]]]:
+    """Run *source*'s search; returns its result record and the job stubs found."""
+    result = ScrapeResult(source=source)
+    search = _SOURCES[source][0]
+    try:
+        stubs = await search(client, query, location, max_results)
+    except Exception as e:
+        result.errors.append(f"Search failed: {str(e)[:200]}")
+        return result, []
+    result.jobs_found = len(stubs)
+    return result, stubs
+
+
+async def _enrich_source(
+    client: httpx.AsyncClient,
+    result: ScrapeResult,
+    stubs: list[dict[str, Any]],
     existing_urls: set[str],
-    db: AsyncSession,
+    rows: list[dict[str, Any]],
     fetch_details: bool,
-) -> ScrapeResult:
-    """Scrape LinkedIn, fetch details, persist new jobs."""
-    result = ScrapeResult(source="linkedin")
-    async with build_httpx_client() as client:
-        try:
-            stubs = await scrape_linkedin_search(client, query, location, max_results)
-        except Exception as e:
-            result.errors.append(f"Search failed: {str(e)[:200]}")
-            return result
-
-        result.jobs_found = len(stubs)
-
-        for stub in stubs:
-            url = stub.get("job_url", "")
-            if url in existing_urls:
-                result.jobs_skipped_duplicate += 1
-                continue
-
-            description = ""
-            if fetch_details and stub.get("job_id"):
-                try:
-                    description = await fetch_linkedin_job_detail(client, stub["job_id"])
-                    if description:
-                        result.jobs_enriched += 1
-                except Exception as e:
-                    result.errors.append(f"Detail fetch: {str(e)[:100]}")
-
-            if not description:
-                description = stub.get("snippet") or ""
-
-            if len(description.strip()) < 20 and not stub.get("job_title"):
-                continue
+) -> None:
+    """Drop already-known stubs, fetch detail pages for the rest, queue new jobs onto *rows*."""
+    _, fetch, key_field = _SOURCES[result.source]
+    new_stubs = _filter_new(result, stubs, existing_urls)
 
-            job = _stub_to_job(stub, description)
-            db.add(job)
-            existing_urls.add(url)
-            result.jobs_new += 1
-
-    return result
+    # Fetch full descriptions from detail pages
+    descriptions = [""] * len(new_stubs)
+    if fetch_details:
+        descriptions = await _fetch_descriptions(result, new_stubs, fetch, client, key_field)
+    _add_new_jobs(result, new_stubs, descriptions, rows)
 
 
 # ---------------------------------------------------------------------------
@@ -220,26 +245,58 @@ async def run_scrape(
     if sources is None:
         sources = ["indeed", "linkedin"]
 
-    existing_urls = await _get_existing_urls(db)
-    report = ScrapeReport()
-
+    selected: list[str] = []
     for source in sources:
-        if source == "indeed":
-            sr = await _scrape_source_indeed(
-                query, location, max_per_source, existing_urls, db, fetch_details,
-            )
-        elif source == "linkedin":
-            sr = await _scrape_source_linkedin(
-                query, location, max_per_source, existing_urls, db, fetch_details,
-            )
+        if source in _SOURCES:
+            selected.append(source)
         else:
             logger.warning("Unknown scraper source", extra={"source": source})
-            continue
-        report.results.append(sr)
-        report.total_new += sr.jobs_new
 
-    if report.total_new > 0:
-        await db.flush()
+    report = ScrapeReport()
+    stubs_per_source: list[list[dict[str, Any]]] = []
+    rows: list[dict[str, Any]] = []
+
+    # One client for all sources keeps connection pools and TLS sessions warm
+    async with build_httpx_client() as client:
+        # 1. Search every source concurrently (they hit different hosts)
+        searched = await asyncio.gather(
+            *[_search_source(client, source, query, location, max_per_source) for source in selected],
+            return_exceptions=True,
+        )
+        for source, item in zip(selected, searched):
+            if isinstance(item, Exception):
+                logger.error("Scraper source failed", extra={"source": source, "error": str(item)[:200]})
+                item = (ScrapeResult(source=source, errors=[f"Scrape failed: {str(item)[:200]}"]), [])
+            report.results.append(item[0])
+            stubs_per_source.append(item[1])
+
+        # 2. One indexed lookup for every URL found in this run, not the whole table
+        existing_urls = await get_existing_urls(
+            db, [stub["job_url"] for stubs in stubs_per_source for stub in stubs if stub.get("job_url")],
+        )
+
+        # 3. Fetch details for new jobs only
+        enriched = await asyncio.gather(
+            *[
+                _enrich_source(client, sr, stubs, existing_urls, rows, fetch_details)
+                for sr, stubs in zip(report.results, stubs_per_source)
+            ],
+            return_exceptions=True,
+        )
+        for sr, err in zip(report.results, enriched):
+            if isinstance(err, Exception):
+                logger.error("Scraper source failed", extra={"source": sr.source, "error": str(err)[:200]})
+                sr.errors.append(f"Scrape failed: {str(err)[:200]}")
+
+    # 4. One round-trip for all new jobs. ON CONFLICT covers rows inserted by a
+    # concurrent scrape since the existence lookup; those count as duplicates.
+    if rows:
+        inserted_per_source = Counter(await insert_new_jobs(db, rows))
+        for sr in report.results:
+            conflicts = sr.jobs_new - inserted_per_source[sr.source]
+            sr.jobs_new -= conflicts
+            sr.jobs_skipped_duplicate += conflicts
+    report.total_new = sum(sr.jobs_new for sr in report.results)
 
     logger.info(
         "Scrape run complete",
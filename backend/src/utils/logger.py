@@ -1,21 +1,32 @@
 """
 Structured JSON logging. No PII or secrets logged.
 """
-import json
 import logging
 import sys
 from datetime import datetime, timezone
 from typing import Any
 
+import orjson
+
 from src.config import get_settings
 
+# LogRecord attributes that are not user-supplied `extra` fields
+_LOGRECORD_RESERVED = frozenset({
+    "name", "msg", "args", "created", "filename", "funcName",
+    "levelname", "levelno", "lineno", "module", "msecs",
+    "pathname", "process", "processName", "relativeCreated",
+    "stack_info", "exc_info", "exc_text", "thread", "threadName",
+    "message", "taskName",
+})
+
 
 class JSONFormatter(logging.Formatter):
     """Format log records as JSON for production log aggregation."""
 
     def format(self, record: logging.LogRecord) -> str:
         log_obj: dict[str, Any] = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            # orjson serializes datetimes natively (RFC 3339, "Z" suffix)
+            "timestamp": datetime.now(timezone.utc),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -24,18 +35,14 @@ class JSONFormatter(logging.Formatter):
             log_obj["exception"] = self.formatException(record.exc_info)
         # Include extra fields that don't conflict with LogRecord
         for key, value in record.__dict__.items():
-            if key not in (
-                "name", "msg", "args", "created", "filename", "funcName",
-                "levelname", "levelno", "lineno", "module", "msecs",
-                "pathname", "process", "processName", "relativeCreated",
-                "stack_info", "exc_info", "exc_text", "thread", "threadName",
-                "message", "taskName",
-            ) and not key.startswith("_"):
+            if key not in _LOGRECORD_RESERVED and not key.startswith("_"):
                 try:
                     log_obj[key] = value
                 except (TypeError, ValueError):
                     pass
-        return json.dumps(log_obj, default=str)
+        return orjson.dumps(
+            log_obj, default=str, option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS,
+        ).decode()
 
 
 def setup_logging() -> None:
@@ -1,10 +1,13 @@
 """
 Password hashing and JWT token handling. No plain-text passwords in logs.
-Uses bcrypt directly (not passlib) to avoid passlib's 72-byte internal test.
+Uses bcrypt directly (not passlib) to avoid passlib's 72-byte internal test;
+argon2id (argon2-cffi) is available via settings.password_hasher.
 """
+import asyncio
 import hashlib
 import secrets
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 
 import bcrypt
 from jose import JWTError, jwt
@@ -18,6 +21,11 @@ logger = get_logger(__name__)
 BCRYPT_MAX_PASSWORD_BYTES = 72
 BCRYPT_ROUNDS = 12
 
+# argon2id parameters: 2 passes over 64 MiB with 2 lanes
+ARGON2_TIME_COST = 2
+ARGON2_MEMORY_COST_KIB = 65536
+ARGON2_PARALLELISM = 2
+
 
 def _to_bcrypt_bytes(s: str) -> bytes:
     """Truncate password to 72 bytes for bcrypt (required by algorithm)."""
@@ -27,22 +35,52 @@ def _to_bcrypt_bytes(s: str) -> bytes:
     return raw[:BCRYPT_MAX_PASSWORD_BYTES]
 
 
+@lru_cache
+def _argon2_hasher():
+    """argon2id hasher, imported lazily so bcrypt-only deployments don't need argon2-cffi."""
+    from argon2 import PasswordHasher
+
+    return PasswordHasher(
+        time_cost=ARGON2_TIME_COST,
+        memory_cost=ARGON2_MEMORY_COST_KIB,
+        parallelism=ARGON2_PARALLELISM,
+    )
+
+
 def hash_password(plain_password: str) -> str:
-    """Hash password with bcrypt (cost factor 12). Empty password allowed for demo."""
+    """
+    Hash password with the configured hasher (bcrypt cost 12 by default, or
+    argon2id). Empty password allowed for demo. CPU-bound: from async code use
+    hash_password_async.
+    """
+    if get_settings().password_hasher == "argon2":
+        return _argon2_hasher().hash(plain_password or "")
     secret = _to_bcrypt_bytes(plain_password or "")
     salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
     return bcrypt.hashpw(secret, salt).decode("ascii")
 
 
 def verify_password(plain_password: str, hashed: str) -> bool:
-    """Verify plain password against hash."""
-    secret = _to_bcrypt_bytes(plain_password or "")
+    """Verify plain password against a bcrypt or argon2 hash (detected from its prefix)."""
     try:
+        if hashed.startswith("$argon2"):
+            return _argon2_hasher().verify(hashed, plain_password or "")
+        secret = _to_bcrypt_bytes(plain_password or "")
         return bcrypt.checkpw(secret, hashed.encode("ascii"))
     except Exception:
         return False
 
 
+async def hash_password_async(plain_password: str) -> str:
+    """hash_password in a worker thread so the event loop keeps serving requests."""
+    return await asyncio.to_thread(hash_password, plain_password)
+
+
+async def verify_password_async(plain_password: str, hashed: str) -> bool:
+    """verify_password in a worker thread so the event loop keeps serving requests."""
+    return await asyncio.to_thread(verify_password, plain_password, hashed)
+
+
 def create_access_token(subject: str, expires_delta: timedelta | None = None) -> str:
     """Create JWT access token. Subject is typically user id (str)."""
     settings = get_settings()
@@ -63,7 +101,15 @@ def create_refresh_token() -> str:
 
 
 def hash_refresh_token(token: str) -> str:
-    """Store only hash of refresh token."""
+    """Store only hash of refresh token (BLAKE2b-256, hex)."""
+    return hashlib.blake2b(token.encode(), digest_size=32).hexdigest()
+
+
+def legacy_refresh_token_hash(token: str) -> str:
+    """
+    SHA-256 hash used before the switch to BLAKE2b. Only for looking up tokens
+    issued before then; drop once refresh_token_expire_days have passed.
+    """
     return hashlib.sha256(token.encode()).hexdigest()
 
 
@@ -2,24 +2,77 @@
 Input validation and sanitization. Used by API and services.
 """
 import re
+import string
+from functools import lru_cache
 from html import escape
 
-# Email: reasonable format, no leading/trailing spaces
+# Email: reasonable format, no leading/trailing spaces. Domain labels cannot
+# contain ".", so each segment has one way to match; possessive quantifiers
+# (Python 3.11+) stop the engine retrying alternatives on failure.
 EMAIL_PATTERN = re.compile(
-    r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
+    r"^[a-zA-Z0-9._%+-]++@(?:[a-zA-Z0-9-]++\.)++[a-zA-Z]{2,}+$"
 )
 
-# Password: min 8 chars, at least one upper, one lower, one digit
+# Password: min 8 chars, at least one upper, one lower, one digit (ASCII, as in
+# validate_password_strength)
 PASSWORD_PATTERN = re.compile(
-    r"^(?=.*[a-z])(?=.*[A-Z])(?=.*\d).{8,}$"
+    r"^(?=.*[a-z])(?=.*[A-Z])(?=.*[0-9]).{8,}$"
 )
 
+# Character classes checked individually so the error names what is missing.
+# frozenset.isdisjoint(str) walks the string in C without building a Match.
+_LOWER = frozenset(string.ascii_lowercase)
+_UPPER = frozenset(string.ascii_uppercase)
+_DIGITS = frozenset(string.digits)
 
+# RFC 5321 limits on the local part and domain
+MAX_EMAIL_LOCAL_LENGTH = 64
+MAX_EMAIL_DOMAIN_LENGTH = 253
+
+# Distinct emails remembered by validate_email. Passwords are never cached.
+EMAIL_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=EMAIL_CACHE_SIZE)
 def validate_email(email: str) -> bool:
-    """Return True if email format is valid."""
-    if not email or len(email) > 255:
+    """Return True if email format is valid. Memoized: repeat lookups skip the checks."""
+    return _validate_email_uncached(email)
+
+
+def _validate_email_uncached(email: str) -> bool:
+    if not email or len(email) > 255 or "@" not in email:
+        return False
+    # Only copy the string when there is whitespace to strip
+    if email[0].isspace() or email[-1].isspace():
+        email = email.strip()
+    # EMAIL_PATTERN is ASCII-only; isascii() is an O(1) flag check on str
+    if not email.isascii():
+        return False
+    # Cheap structural checks first, so malformed input never reaches the regex
+    if email.count("@") != 1:
         return False
-    return bool(EMAIL_PATTERN.match(email.strip()))
+    local, _, domain = email.partition("@")
+    if len(local) > MAX_EMAIL_LOCAL_LENGTH or len(domain) > MAX_EMAIL_DOMAIN_LENGTH:
+        return False
+    if ".." in email or email.startswith(".") or email.endswith("."):
+        return False
+    return bool(EMAIL_PATTERN.match(email))
+
+
+def validate_emails_bulk(emails: list[str]) -> list[bool]:
+    """
+    Validate many emails (e.g. an import); results are in input order.
+    Bypasses validate_email's LRU so a large batch doesn't evict the entries
+    the login/register path relies on; duplicates are memoized per call.
+    """
+    seen: dict[str, bool] = {}
+    results: list[bool] = []
+    for email in emails:
+        ok = seen.get(email)
+        if ok is None:
+            ok = seen[email] = _validate_email_uncached(email)
+        results.append(ok)
+    return results
 
 
 def validate_password_strength(password: str) -> tuple[bool, str]:
@@ -29,11 +82,11 @@ def validate_password_strength(password: str) -> tuple[bool, str]:
     """
     if len(password) < 8:
         return False, "Password must be at least 8 characters"
-    if not re.search(r"[a-z]", password):
+    if _LOWER.isdisjoint(password):
         return False, "Password must contain at least one lowercase letter"
-    if not re.search(r"[A-Z]", password):
+    if _UPPER.isdisjoint(password):
         return False, "Password must contain at least one uppercase letter"
-    if not re.search(r"\d", password):
+    if _DIGITS.isdisjoint(password):
         return False, "Password must contain at least one number"
     return True, ""
 
@@ -43,4 +96,8 @@ def sanitize_string(value: str | None, max_length: int = 10_000) -> str:
     if value is None:
         return ""
     s = str(value).strip()[:max_length]
+    # Substring tests use CPython's memchr-based fastsearch, far quicker than
+    # escape()'s chain of replace() scans; most values have nothing to escape.
+    if not ("&" in s or "<" in s or ">" in s or '"' in s or "'" in s):
+        return s
     return escape(s)
@@ -0,0 +1,45 @@
+"""Unit tests for LLM response cache."""
+import asyncio
+
+from src.services.llm.cache import cached_json, make_cache_key
+
+
+async def test_cached_json_coalesces_concurrent_calls():
+    calls = 0
+
+    async def producer():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"skills": ["python"]}
+
+    key = make_cache_key("prompt", "coalesce")
+    results = await asyncio.gather(*(cached_json(key, producer) for _ in range(5)))
+    assert calls == 1
+    assert all(r == {"skills": ["python"]} for r in results)
+
+    assert await cached_json(key, producer) == {"skills": ["python"]}
+    assert calls == 1
+
+
+async def test_cached_json_propagates_errors_without_caching():
+    calls = 0
+
+    async def failing():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    key = make_cache_key("prompt", "errors")
+    results = await asyncio.gather(
+        *(cached_json(key, failing) for _ in range(3)), return_exceptions=True
+    )
+    assert calls == 1
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+    try:
+        await cached_json(key, failing)
+    except RuntimeError:
+        pass
+    assert calls == 2
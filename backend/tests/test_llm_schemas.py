@@ -0,0 +1,36 @@
+"""Unit tests for LLM response schemas."""
+from src.services.llm.schemas import CVAnalysis, JobAnalysis, strict_json_schema
+
+
+def test_job_analysis_normalizes_loose_output():
+    data = JobAnalysis.model_validate_json(
+        '{"required_skills": [" Python ", "", 3], "preferred_skills": "AWS",'
+        ' "experience_level": "", "experience_years": 5, "company_size": null}'
+    ).model_dump()
+    assert data["required_skills"] == ["Python", "3"]
+    assert data["preferred_skills"] == []
+    assert data["experience_level"] is None
+    assert data["experience_years"] == "5"
+    assert data["key_responsibilities"] == []
+
+
+def test_cv_analysis_competencies_and_years():
+    data = CVAnalysis.model_validate({
+        "skills": ["Go"] * 60,
+        "skill_competencies": [{"skill": "Go", "level": 9}, {"level": 4}, "Rust"],
+        "experience": [{"company": "Acme", "role": "Dev", "duration": "2 years"}, "bad"],
+        "total_years_experience": -2.5,
+    }).model_dump()
+    assert len(data["skills"]) == 50
+    assert data["skill_competencies"] == [{"skill": "Go", "level": 3}]
+    assert data["experience"] == [{"company": "Acme", "role": "Dev", "duration": "2 years"}]
+    assert data["total_years_experience"] == 0
+
+
+def test_strict_json_schema_closes_objects():
+    schema = strict_json_schema(CVAnalysis)
+    assert schema["additionalProperties"] is False
+    assert set(schema["required"]) == set(schema["properties"])
+    competency = schema["$defs"]["SkillCompetency"]
+    assert competency["required"] == ["skill", "level"]
+    assert "default" not in competency["properties"]["level"]
@@ -0,0 +1,18 @@
+"""Unit tests for structured logging."""
+import json
+import logging
+
+from src.utils.logger import JSONFormatter
+
+
+def test_json_formatter_serializes_extra_fields():
+    record = logging.LogRecord("scraper", logging.INFO, __file__, 1, "fetched %s", ("page",), None)
+    record.status_counts = {200: 3, 404: 1}
+    record.url = "https://example.com"
+
+    out = json.loads(JSONFormatter().format(record))
+
+    assert out["message"] == "fetched page"
+    assert out["status_counts"] == {"200": 3, "404": 1}
+    assert out["url"] == "https://example.com"
+    assert out["timestamp"].endswith("Z")
@@ -1,7 +1,11 @@
 """Unit tests for matching algorithm."""
 from datetime import date, timedelta
 
-from src.services.matching.job_matcher import compute_match_score
+import pytest
+
+from src.services.matching.job_matcher import compute_match_score, _experience_level_score
+
+TODAY = date.today()
 
 
 def test_matching_score_full_match():
@@ -14,7 +18,7 @@ def test_matching_score_full_match():
         job_experience_level="senior",
         job_experience_years_range="5-7",
         job_location=None,
-        job_posted_date=date.today() - timedelta(days=2),
+        job_posted_date=TODAY - timedelta(days=2),
     )
     assert score >= 80
     assert "skill_match_required" in details
@@ -31,7 +35,21 @@ def test_matching_score_no_skills_overlap():
         job_experience_level="mid",
         job_experience_years_range="2-4",
         job_location=None,
-        job_posted_date=date.today(),
+        job_posted_date=TODAY,
     )
     assert score < 70
     assert sorted(details.get("missing_required_skills", [])) == ["go", "python"]
+
+
+@pytest.mark.parametrize(
+    "years,level,expected",
+    [
+        (5, "Senior", 1.0),
+        (2, "senior", 0.6),
+        (None, "lead", 0.2),
+        (12, "principal", 0.7),
+        (3, None, 0.7),
+    ],
+)
+def test_experience_level_score_levels(years, level, expected):
+    assert _experience_level_score(years, level, None) == expected
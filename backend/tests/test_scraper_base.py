@@ -0,0 +1,63 @@
+"""Unit tests for shared scraper utilities."""
+import asyncio
+
+import httpx
+
+from src.config import get_settings
+from src.services.scraper import base_scraper
+
+
+async def test_rate_limit_below_one_per_second(monkeypatch):
+    monkeypatch.setattr(get_settings(), "scraping_rate_limit_per_second", 0.5)
+    monkeypatch.setattr(base_scraper, "_limiters", {})
+
+    # First request goes straight through; the next waits ~2s for a token
+    await asyncio.wait_for(base_scraper.rate_limit_for("https://slow.example.com/a"), timeout=1.0)
+    limiter = base_scraper._limiters["slow.example.com"]
+    assert not limiter.has_capacity()
+    assert limiter.time_period == 2.0
+
+
+async def test_conditional_get_revalidates_and_serves_stored_body(monkeypatch):
+    async def no_wait(url):
+        return None
+
+    monkeypatch.setattr(base_scraper, "rate_limit_for", no_wait)
+    seen_headers = []
+
+    def handler(request):
+        seen_headers.append(request.headers)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(
+            200,
+            content=b"<html>jobs</html>",
+            headers={"ETag": '"v1"', "Last-Modified": "Mon, 05 Feb 2026 10:00:00 GMT",
+                     "Content-Type": "text/html"},
+        )
+
+    store = {}
+    url = "https://jobs.example.com/search?q=python"
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        first = await base_scraper.fetch_with_retry(client, url, etag_store=store)
+        second = await base_scraper.fetch_with_retry(client, url, etag_store=store)
+
+    assert "If-None-Match" not in seen_headers[0]
+    assert seen_headers[1]["If-None-Match"] == '"v1"'
+    assert seen_headers[1]["If-Modified-Since"] == "Mon, 05 Feb 2026 10:00:00 GMT"
+    assert first.text == second.text == "<html>jobs</html>"
+    assert second.status_code == 200
+    assert second.headers["Content-Type"] == "text/html"
+
+
+def test_response_cache_evicts_oldest_over_byte_limit(monkeypatch):
+    monkeypatch.setattr(base_scraper, "_MAX_RESPONSE_CACHE_BYTES", 10)
+    store = {}
+    for url in ("a", "b", "c"):
+        resp = httpx.Response(200, content=b"12345", headers={"ETag": url})
+        base_scraper._remember_response(store, url, resp)
+    assert list(store) == ["b", "c"]
+
+    # Bodies larger than the whole budget are not stored at all
+    base_scraper._remember_response(store, "big", httpx.Response(200, content=b"x" * 11, headers={"ETag": "x"}))
+    assert list(store) == ["b", "c"]
@@ -0,0 +1,104 @@
+"""Unit tests for the Indeed and LinkedIn HTML parsers."""
+from datetime import date
+
+from src.services.scraper.indeed_scraper import (
+    INDEED_BASE,
+    parse_indeed_detail_html,
+    parse_indeed_search_html,
+)
+from src.services.scraper.linkedin_scraper import (
+    parse_linkedin_detail_html,
+    parse_linkedin_search_html,
+)
+
+_LINKEDIN_CARD = """
+<li>
+  <div class="base-card" data-entity-urn="urn:li:jobPosting:3812345678">
+    <a class="base-card__full-link" href="https://www.linkedin.com/jobs/view/python-dev-3812345678?refId=x"></a>
+    <h3 class="base-search-card__title"> Python Developer </h3>
+    <h4 class="base-search-card__subtitle">Acme Inc</h4>
+    <div class="base-search-card__metadata">
+      <span class="job-search-card__salary-info">$100k</span>
+      <span class="job-search-card__location">NYC</span>
+      <time datetime="2026-02-05">1 week ago</time>
+    </div>
+  </div>
+</li>
+"""
+
+_INDEED_CARD = """
+<div class="job_seen_beacon" data-jk="abc123">
+  <h2 class="jobTitle"><a href="/viewjob?jk=abc123"><span>Backend Engineer</span></a></h2>
+  <div class="company"><span class="companyName">Acme Inc</span><span>4.2 rating</span></div>
+  <div class="companyLocation">Remote</div>
+  <div class="snippet-wrapper"><div class="job-snippet">Great job</div><div>Benefits blah</div></div>
+  <span class="date">Posted 3 days ago</span>
+</div>
+"""
+
+
+def test_linkedin_search_parses_card():
+    [job] = parse_linkedin_search_html(_LINKEDIN_CARD)
+    assert job["job_id"] == "3812345678"
+    assert job["job_url"] == "https://www.linkedin.com/jobs/view/3812345678"
+    assert job["job_title"] == "Python Developer"
+    assert job["company_name"] == "Acme Inc"
+    assert job["posted_date"] == date(2026, 2, 5)
+
+
+def test_linkedin_search_prefers_location_class_over_earlier_metadata_span():
+    [job] = parse_linkedin_search_html(_LINKEDIN_CARD)
+    assert job["location"] == "NYC"
+
+
+def test_linkedin_search_skips_card_without_job_link():
+    assert parse_linkedin_search_html('<div class="base-card"><h3>No link</h3></div>') == []
+
+
+def test_indeed_search_parses_card():
+    [job] = parse_indeed_search_html(_INDEED_CARD, INDEED_BASE)
+    assert job["job_url"] == f"{INDEED_BASE}/viewjob?jk=abc123"
+    assert job["job_title"] == "Backend Engineer"
+    assert job["location"] == "Remote"
+    assert job["posted_date"] is not None
+
+
+def test_indeed_search_fallbacks_keep_priority_over_ancestors():
+    [job] = parse_indeed_search_html(_INDEED_CARD, INDEED_BASE)
+    assert job["company_name"] == "Acme Inc"
+    assert job["snippet"] == "Great job"
+
+
+def test_indeed_search_builds_url_from_relative_link():
+    html = '<table><tr><td class="resultContent"><a href="/rc/clk?id=9">Data Analyst</a></td></tr></table>'
+    [job] = parse_indeed_search_html(html, INDEED_BASE)
+    assert job["job_url"] == f"{INDEED_BASE}/rc/clk?id=9"
+
+
+_DESCRIPTION_BODY = (
+    "<div>\n <p>Hello <b>world</b></p>\n <ul><li>One</li><li>Two</li></ul></div>"
+)
+
+
+def test_indeed_detail_drops_blank_lines():
+    html = f'<html><body><div id="jobDescriptionText">{_DESCRIPTION_BODY}</div></body></html>'
+    assert parse_indeed_detail_html(html) == "Hello\nworld\nOne\nTwo"
+
+
+def test_linkedin_detail_drops_blank_lines():
+    html = f'<section><div class="show-more-less-html__markup">{_DESCRIPTION_BODY}</div></section>'
+    assert parse_linkedin_detail_html(html) == "Hello\nworld\nOne\nTwo"
+
+
+def test_detail_truncates_after_dropping_blank_lines():
+    items = "\n  ".join(f"<p>line {i}</p>" for i in range(3000))
+    html = f'<div id="jobDescriptionText">\n  {items}\n</div>'
+    text = parse_indeed_detail_html(html)
+    assert len(text) == 15_000
+    assert "\n\n" not in text
+    assert text.startswith("line 0\nline 1\n")
+
+
+def test_detail_missing_description_returns_empty():
+    assert parse_indeed_detail_html("<html><body><p>Nothing here</p></body></html>") == ""
+    assert parse_linkedin_detail_html("<html><body></body></html>") == ""
@@ -1,12 +1,15 @@
 """Unit tests for security utilities."""
-import pytest
+from src.config import get_settings
 from src.utils.security import (
     hash_password,
+    hash_password_async,
     verify_password,
+    verify_password_async,
     create_access_token,
     decode_access_token,
     create_refresh_token,
     hash_refresh_token,
+    legacy_refresh_token_hash,
 )
 
 
@@ -19,6 +22,16 @@ def test_password_hashing():
     assert not verify_password("wrong", hashed)
 
 
+async def test_argon2_hashing_verifies_alongside_bcrypt(monkeypatch):
+    bcrypt_hash = hash_password("SecureP@ss1")
+    monkeypatch.setattr(get_settings(), "password_hasher", "argon2")
+    hashed = await hash_password_async("SecureP@ss1")
+    assert hashed.startswith("$argon2id$")
+    assert await verify_password_async("SecureP@ss1", hashed)
+    assert not await verify_password_async("wrong", hashed)
+    assert verify_password("SecureP@ss1", bcrypt_hash)
+
+
 def test_jwt_token_generation():
     user_id = "550e8400-e29b-41d4-a716-446655440000"
     token = create_access_token(user_id)
@@ -36,3 +49,5 @@ def test_refresh_token_and_hash():
     h = hash_refresh_token(token)
     assert h != token
     assert hash_refresh_token(token) == h
+    assert len(h) == 64
+    assert legacy_refresh_token_hash(token) != h
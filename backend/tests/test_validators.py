@@ -2,28 +2,55 @@
 import pytest
 from src.utils.validators import (
     validate_email,
+    validate_emails_bulk,
     validate_password_strength,
     sanitize_string,
 )
 
 
-def test_validate_email():
-    assert validate_email("user@example.com") is True
-    assert validate_email("user.name+tag@domain.co.uk") is True
-    assert validate_email("invalid") is False
-    assert validate_email("") is False
-    assert validate_email("a" * 256) is False
-
-
-def test_validate_password_strength():
-    ok, _ = validate_password_strength("Short1")
-    assert ok is False
-    ok, _ = validate_password_strength("nouppercase1")
-    assert ok is False
-    ok, _ = validate_password_strength("NOLOWERCASE1")
-    assert ok is False
-    ok, _ = validate_password_strength("NoNumbers")
-    assert ok is False
-    ok, msg = validate_password_strength("ValidPass1")
-    assert ok is True
-    assert msg == ""
+@pytest.mark.parametrize(
+    "email,expected",
+    [
+        ("user@example.com", True),
+        ("user.name+tag@domain.co.uk", True),
+        ("invalid", False),
+        ("", False),
+        ("a" * 256, False),
+        ("a@b@example.com", False),
+        ("a..b@example.com", False),
+        ("a" * 65 + "@example.com", False),
+        ("a@.example.com", False),
+    ],
+)
+def test_validate_email(email, expected):
+    assert validate_email(email) is expected
+
+
+def test_validate_emails_bulk():
+    validate_email.cache_clear()
+    emails = ["user@example.com", "invalid", "", "user@example.com"]
+    assert validate_emails_bulk(emails) == [True, False, False, True]
+    assert validate_email.cache_info().currsize == 0
+
+
+@pytest.mark.parametrize(
+    "password,expected_ok",
+    [
+        ("Short1", False),
+        ("nouppercase1", False),
+        ("NOLOWERCASE1", False),
+        ("NoNumbers", False),
+        ("ValidPass1", True),
+    ],
+)
+def test_validate_password_strength(password, expected_ok):
+    ok, msg = validate_password_strength(password)
+    assert ok is expected_ok
+    assert (msg == "") is expected_ok
+
+
+def test_sanitize_string():
+    assert sanitize_string(None) == ""
+    assert sanitize_string("  plain text  ") == "plain text"
+    assert sanitize_string("<b>Tom & \"Jerry's\"</b>") == "&lt;b&gt;Tom &amp; &quot;Jerry&#x27;s&quot;&lt;/b&gt;"
+    assert sanitize_string("x" * 20, max_length=5) == "xxxxx"